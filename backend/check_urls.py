@@ -5,12 +5,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
 from django.urls import get_resolver
-from rest_framework.routers import DefaultRouter
-from dashboard.views import DashboardViewSet
-
-# Check what the router generates
-router = DefaultRouter()
-router.register(r'', DashboardViewSet, basename='dashboard')
+# Reuse the router built at import time instead of constructing a second one
+from dashboard.urls import router
 
 print("Router URLs:")
 for pattern in router.urls:
@@ -1,5 +1,68 @@
+import logging
+import os
+
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
+# Guard against the watcher being started twice in one process
+_watcher_started = False
+
 
 class DashboardConfig(AppConfig):
     name = 'dashboard'
+
+    def ready(self):
+        _start_excel_watcher()
+
+
+def _start_excel_watcher():
+    """
+    Watch the Excel file so caches are invalidated by filesystem events
+    instead of a stat() syscall on every request
+    Best effort: without watchdog the per-request mtime check stays in place
+    """
+    global _watcher_started
+    if _watcher_started:
+        return
+
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        logger.debug("watchdog not installed; keeping per-request mtime checks")
+        return
+
+    from . import utils
+
+    excel_path = utils.get_excel_path()
+    watched_path = os.path.abspath(excel_path)
+
+    class ExcelChangeHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Never let an exception escape: a raising dispatch kills the
+            # observer thread, which would leave _get_mtime serving the
+            # remembered mtime (and thus stale data) forever
+            try:
+                paths = {getattr(event, 'src_path', None), getattr(event, 'dest_path', None)}
+                if watched_path in {os.path.abspath(p) for p in paths if p}:
+                    utils.notify_excel_changed(excel_path)
+            except Exception:
+                logger.exception(
+                    "Excel file watcher failed; reverting to per-request mtime checks")
+                utils.disable_mtime_watch()
+
+    observer = Observer()
+    observer.daemon = True
+    try:
+        observer.schedule(ExcelChangeHandler(), os.path.dirname(watched_path))
+        observer.start()
+    except OSError as e:
+        # e.g. inotify watch limits or a missing directory; keep the
+        # per-request mtime check in that case
+        logger.warning("Could not start Excel file watcher: %s", e)
+        return
+
+    utils.enable_mtime_watch()
+    _watcher_started = True
+    logger.debug("Excel file watcher started for %s", watched_path)
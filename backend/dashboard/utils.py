@@ -1,29 +1,158 @@
+import functools
 import os
+import re
 import pandas as pd
 from django.conf import settings
+from django.core.cache import cache
 from datetime import datetime
 from decouple import config
 import gspread
 from google.oauth2.service_account import Credentials
 import io
+import logging
+import openpyxl
 import requests
 
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session so public-export fetches reuse pooled connections
+# instead of paying a fresh TCP+TLS handshake per call
+_SESSION = requests.Session()
+_SESSION.mount('https://', requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# Cache of parsed DataFrames keyed by (path, mtime) so repeat reads of an
+# unchanged workbook skip the full XLSX parse
+_EXCEL_CACHE = {}
+
+# When the filesystem watcher (started from dashboard.apps) is running,
+# changes invalidate the caches via notify_excel_changed, so read paths
+# can reuse the last stat result instead of a syscall per request
+_MTIME_CACHE = {}
+_WATCHER_ACTIVE = False
+
+def enable_mtime_watch():
+    """Called from apps.ready() once a filesystem watcher is running"""
+    global _WATCHER_ACTIVE
+    _WATCHER_ACTIVE = True
+
+def disable_mtime_watch():
+    """
+    Revert to per-request stat() checks, e.g. when the watcher fails
+    Clears the remembered mtimes so no stale key survives the switch
+    """
+    global _WATCHER_ACTIVE
+    _WATCHER_ACTIVE = False
+    _MTIME_CACHE.clear()
+
+def notify_excel_changed(excel_path):
+    """Watcher callback: drop every cache derived from the file"""
+    _invalidate_excel_cache(excel_path)
+
+def _get_mtime(excel_path):
+    """mtime for cache keys; skips the stat() when the watcher is active"""
+    if _WATCHER_ACTIVE:
+        mtime = _MTIME_CACHE.get(excel_path)
+        if mtime is None:
+            mtime = os.path.getmtime(excel_path)
+            _MTIME_CACHE[excel_path] = mtime
+        return mtime
+    return os.path.getmtime(excel_path)
+
+def _shrink_low_cardinality(df):
+    """
+    Store low-cardinality string columns as categoricals
+    Remark holds a handful of fixed values, so int8 codes plus a small
+    dictionary replace one Python string object per row
+    """
+    if not len(df):
+        return df
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        if col == 'Remark' or df[col].nunique() / len(df) < 0.01:
+            df[col] = df[col].astype('category')
+    return df
+
+def _load_excel_cached(excel_path, nrows=None):
+    """
+    Read an Excel file through a (path, mtime, nrows)-keyed cache
+    Re-parses only when the file on disk has changed
+    When nrows is given, only that many data rows are read from disk
+    Returns (df, columns) with the column tuple cached at parse time so
+    hot endpoints don't rebuild header lists on every request
+    """
+    mtime = _get_mtime(excel_path)
+    cache_key = (excel_path, mtime, nrows)
+    entry = _EXCEL_CACHE.get(cache_key)
+    if entry is None:
+        # A cached full read already covers any bounded request
+        full = _EXCEL_CACHE.get((excel_path, mtime, None))
+        if full is not None:
+            df, columns = full
+            return df.head(nrows), columns
+        # calamine is a native (Rust) parser, much faster and leaner than
+        # the pure-Python openpyxl path; writes still go through openpyxl.
+        # The handle is opened per parse: calamine workbooks are stateful
+        # and cannot be shared (or closed) across threads safely
+        with pd.ExcelFile(excel_path, engine='calamine') as xl:
+            df = _shrink_low_cardinality(xl.parse(xl.sheet_names[0], nrows=nrows))
+        # Drop frames cached for older mtimes of the file
+        for stale in [k for k in _EXCEL_CACHE if k[0] == excel_path and k[1] != mtime]:
+            _EXCEL_CACHE.pop(stale, None)
+        entry = (df, tuple(df.columns))
+        _EXCEL_CACHE[cache_key] = entry
+    df, columns = entry
+    # Shallow copy so callers can't mutate the cached frame
+    return df.copy(deep=False), columns
+
+# get_excel_info results keyed by (path, mtime)
+_INFO_CACHE = {}
+
+# get_excel_stats results keyed by (path, mtime)
+_STATS_CACHE = {}
+
+# Header name -> 1-based column index maps per sheet, so write paths
+# skip the row_values(1) round-trip after the first call
+_HEADER_CACHE = {}
+
+def _get_header_map(sheet_id, worksheet):
+    """Get (and cache) the header -> column index map for a worksheet"""
+    headers = _HEADER_CACHE.get(sheet_id)
+    if headers is None:
+        headers = {name: idx + 1 for idx, name in enumerate(worksheet.row_values(1))}
+        _HEADER_CACHE[sheet_id] = headers
+    return headers
+
+def _invalidate_excel_cache(excel_path):
+    """Drop cached frames for a file after it has been rewritten"""
+    for key in [k for k in _EXCEL_CACHE if k[0] == excel_path]:
+        _EXCEL_CACHE.pop(key, None)
+    for key in [k for k in _INFO_CACHE if k[0] == excel_path]:
+        _INFO_CACHE.pop(key, None)
+    for key in [k for k in _STATS_CACHE if k[0] == excel_path]:
+        _STATS_CACHE.pop(key, None)
+    _MTIME_CACHE.pop(excel_path, None)
+
 def use_google_sheets():
     """Check if we should use Google Sheets"""
     return config('USE_GOOGLE_SHEETS', default='False', cast=bool)
 
+# Matches the ID segment of URLs like
+# https://docs.google.com/spreadsheets/d/SHEET_ID/edit#gid=0
+# regardless of the tail (/edit, ?usp=sharing, #gid=...)
+_SHEET_ID_RE = re.compile(r'/d/([a-zA-Z0-9-_]+)')
+
+@functools.lru_cache(maxsize=1)
 def get_google_sheet_id():
     """Extract sheet ID from Google Sheets URL"""
-    url = config('GOOGLE_SHEET_URL', default='')
-    # Extract ID from URL like: https://docs.google.com/spreadsheets/d/SHEET_ID/edit...
-    if '/d/' in url:
-        return url.split('/d/')[1].split('/')[0]
-    return None
+    match = _SHEET_ID_RE.search(config('GOOGLE_SHEET_URL', default=''))
+    return match.group(1) if match else None
 
+@functools.lru_cache(maxsize=1)
 def get_gspread_client():
     """
     Get authenticated gspread client for write operations
     Reads credentials from environment variables
+    Cached so the RSA key parse and HTTP session are reused across requests;
+    call get_gspread_client.cache_clear() after rotating credentials
     """
     try:
         # Build credentials dict from environment variables
@@ -43,7 +172,7 @@ def get_gspread_client():
         
         # Check if required fields are present
         if not creds_dict['client_email'] or not creds_dict['private_key']:
-            print("Google credentials not found in environment variables")
+            logger.warning("Google credentials not found in environment variables")
             return None
         
         SCOPES = [
@@ -53,16 +182,62 @@ def get_gspread_client():
         
         creds = Credentials.from_service_account_info(creds_dict, scopes=SCOPES)
         client = gspread.authorize(creds)
-        print("✓ Successfully authenticated with Google Sheets API from environment variables")
+        logger.debug("Authenticated with Google Sheets API from environment variables")
         return client
     except Exception as e:
-        print(f"Error authenticating with Google Sheets: {str(e)}")
+        logger.warning("Error authenticating with Google Sheets: %s", e)
         return None
 
-def read_google_sheet_as_excel():
+@functools.lru_cache(maxsize=4)
+def _open_sheet(sheet_id):
+    """
+    Open (and cache) a spreadsheet handle so repeat reads and writes
+    skip the open_by_key metadata round-trip
+    """
+    client = get_gspread_client()
+    if not client:
+        raise ValueError("Google Sheets client not available")
+    return client.open_by_key(sheet_id)
+
+# Seconds to keep Google Sheets pulls in the Django cache; one dashboard
+# load hits /stats, /data and /detailed_stats, so a short TTL collapses
+# those into a single API pull
+GSHEET_CACHE_TTL = 60
+
+# Cache keys handed out per sheet, so a write can invalidate every
+# limit variant without guessing key names
+_GSHEET_CACHE_KEYS = set()
+
+def _invalidate_gsheet_cache(sheet_id):
+    """Drop cached pulls for a sheet after a successful write"""
+    for key in [k for k in _GSHEET_CACHE_KEYS if k.startswith(f'gsheet:{sheet_id}')]:
+        cache.delete(key)
+        _GSHEET_CACHE_KEYS.discard(key)
+
+def read_google_sheet_cached(limit=None):
+    """
+    Read the Google Sheet through a short-TTL Django cache
+    DataFrames don't pickle cheaply, so the cache holds to_json output
+    """
+    sheet_id = get_google_sheet_id()
+    if not sheet_id:
+        raise ValueError("Invalid Google Sheet URL")
+
+    key = f'gsheet:{sheet_id}:{int(limit)}' if limit else f'gsheet:{sheet_id}'
+    _GSHEET_CACHE_KEYS.add(key)
+    payload = cache.get_or_set(
+        key,
+        lambda: read_google_sheet_as_excel(limit=limit).to_json(
+            orient='records', date_format='iso', default_handler=str),
+        timeout=GSHEET_CACHE_TTL,
+    )
+    return pd.read_json(io.StringIO(payload), orient='records')
+
+def read_google_sheet_as_excel(limit=None):
     """
     Read Google Sheet and return as pandas DataFrame
     Uses authenticated access via service account
+    When limit is given, only the header plus that many rows are fetched
     """
     sheet_id = get_google_sheet_id()
     if not sheet_id:
@@ -72,38 +247,56 @@ def read_google_sheet_as_excel():
     client = get_gspread_client()
     if client:
         try:
-            print(f"Reading Google Sheet with authentication: {sheet_id}")
-            spreadsheet = client.open_by_key(sheet_id)
+            logger.debug("Reading Google Sheet with authentication: %s", sheet_id)
+            spreadsheet = _open_sheet(sheet_id)
             worksheet = spreadsheet.sheet1
             
-            # Get all values as list of lists
-            data = worksheet.get_all_values()
-            
-            if not data:
+            # values_get with UNFORMATTED_VALUE returns numbers as numbers,
+            # so pandas doesn't have to re-infer types from strings.
+            # A bounded row range still applies when a limit is set
+            if limit:
+                range_name = f"'{worksheet.title}'!1:{int(limit) + 1}"
+            else:
+                range_name = f"'{worksheet.title}'"
+            raw = spreadsheet.values_get(range_name, params={
+                'valueRenderOption': 'UNFORMATTED_VALUE',
+                'dateTimeRenderOption': 'FORMATTED_STRING',
+            }).get('values', [])
+
+            if not raw:
                 raise Exception("No data found in Google Sheet")
-            
-            # Convert to DataFrame (first row is headers)
-            df = pd.DataFrame(data[1:], columns=data[0])
-            print(f"Successfully loaded Google Sheet. Rows: {len(df)}, Columns: {list(df.columns)}")
+
+            # Build the frame column-wise; the API omits trailing empty
+            # cells, so pad short rows while transposing
+            df = pd.DataFrame({
+                name: [row[i] if i < len(row) else None for row in raw[1:]]
+                for i, name in enumerate(raw[0])
+            })
+            logger.debug("Loaded Google Sheet. Rows: %d", len(df))
             return df
         except Exception as e:
-            print(f"Error reading Google Sheet with authentication: {str(e)}")
+            logger.warning("Error reading Google Sheet with authentication: %s", e)
             # Fall through to try public access
     
     # Fallback: Try public export URL
     export_url = f'https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=xlsx'
     
     try:
-        print(f"Trying public access: {export_url}")
-        response = requests.get(export_url)
+        logger.debug("Trying public access: %s", export_url)
+        response = _SESSION.get(export_url, timeout=30, stream=True)
         response.raise_for_status()
-        
-        # Read Excel data from response content
-        df = pd.read_excel(io.BytesIO(response.content))
-        print(f"Successfully loaded Google Sheet via public export. Rows: {len(df)}, Columns: {list(df.columns)}")
+
+        # Stream the response into a buffer instead of buffering .content twice
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=65536):
+            buffer.write(chunk)
+        buffer.seek(0)
+
+        df = pd.read_excel(buffer, sheet_name=0, engine='calamine')
+        logger.debug("Loaded Google Sheet via public export. Rows: %d", len(df))
         return df
     except Exception as e:
-        print(f"Error reading Google Sheet via public export: {str(e)}")
+        logger.warning("Error reading Google Sheet via public export: %s", e)
         raise Exception(f"Failed to read Google Sheet. Make sure it's shared with the service account: nmt-dashboard-service@dashboard-nmt-project.iam.gserviceaccount.com")
 
 def get_excel_path():
@@ -113,40 +306,31 @@ def get_excel_path():
 def read_excel_data(limit=None):
     """
     Read data from Excel file or Google Sheets
-    Returns: DataFrame or dict
+    Returns: (row_count, records_json) where records_json is the rows
+    serialized as a JSON array in one native to_json pass
     """
     try:
         if use_google_sheets():
-            print("Using Google Sheets as data source")
-            df = read_google_sheet_as_excel()
+            logger.debug("Using Google Sheets as data source")
+            df = read_google_sheet_cached(limit=limit)
         else:
-            print("Using local Excel file as data source")
+            logger.debug("Using local Excel file as data source")
             excel_path = get_excel_path()
-            
+
             if not os.path.exists(excel_path):
                 raise FileNotFoundError(f"Excel file not found at {excel_path}")
-            
-            df = pd.read_excel(excel_path)
-        
-        # Limit rows if specified
-        if limit:
-            df = df.head(limit)
-        
-        # Convert DataFrame to list of dictionaries for JSON serialization
-        # Handle NaN values and dates
-        data = df.fillna('').to_dict('records')
-        
-        # Convert any datetime objects to strings
-        for record in data:
-            for key, value in record.items():
-                if pd.isna(value):
-                    record[key] = None
-                elif isinstance(value, (pd.Timestamp, datetime)):
-                    record[key] = value.strftime('%Y-%m-%d')
-        
-        return data
+
+            # Push the limit into the reader so parsing stops after limit rows
+            df, _ = _load_excel_cached(excel_path, nrows=int(limit) if limit else None)
+
+        # One C-level serialization pass: to_json handles NaN -> null and
+        # datetimes -> ISO strings itself, so no intermediate records list
+        # or per-cell cleanup is needed
+        records_json = df.to_json(orient='records', date_format='iso', default_handler=str)
+
+        return len(df), records_json.encode()
     except Exception as e:
-        print(f"Error in read_excel_data: {str(e)}")
+        logger.warning("Error in read_excel_data: %s", e)
         raise
 
 def get_excel_info():
@@ -155,7 +339,7 @@ def get_excel_info():
     """
     try:
         if use_google_sheets():
-            df = read_google_sheet_as_excel()
+            df = read_google_sheet_cached()
             return {
                 'total_rows': len(df),
                 'columns': list(df.columns),
@@ -169,48 +353,76 @@ def get_excel_info():
             if not os.path.exists(excel_path):
                 return None
             
-            df = pd.read_excel(excel_path)
-            
-            # Get file modification time
-            mod_time = os.path.getmtime(excel_path)
-            last_modified = datetime.fromtimestamp(mod_time).strftime('%Y-%m-%d %H:%M:%S')
-            
-            return {
-                'total_rows': len(df),
-                'columns': list(df.columns),
-                'file_path': excel_path,
-                'source': 'Local Excel',
-                'last_modified': last_modified,
-            }
+            mod_time = _get_mtime(excel_path)
+            cache_key = (excel_path, mod_time)
+            info = _INFO_CACHE.get(cache_key)
+            if info is None:
+                # Only the dimensions and header row are needed here, so a
+                # read-only workbook avoids parsing any data cells
+                wb = openpyxl.load_workbook(excel_path, read_only=True)
+                try:
+                    ws = wb.active
+                    total_rows = max((ws.max_row or 1) - 1, 0)
+                    columns = [c.value for c in next(ws.iter_rows(max_row=1))]
+                finally:
+                    wb.close()
+
+                info = {
+                    'total_rows': total_rows,
+                    'columns': columns,
+                    'file_path': excel_path,
+                    'source': 'Local Excel',
+                    'last_modified': datetime.fromtimestamp(mod_time).strftime('%Y-%m-%d %H:%M:%S'),
+                }
+                _INFO_CACHE.clear()
+                _INFO_CACHE[cache_key] = info
+
+            return info
     except Exception as e:
         return {
             'error': str(e),
             'source': 'Google Sheets' if use_google_sheets() else 'Local Excel',
         }
 
+def _compute_excel_stats(df, source, columns=None):
+    """Build the stats payload for a loaded DataFrame"""
+    if columns is None:
+        columns = tuple(df.columns)
+
+    stats = {
+        'total_rows': len(df),
+        'total_columns': len(columns),
+        'columns': columns,
+        'source': source,
+    }
+
+    # Add basic statistics for numeric columns; resolve the column
+    # selection once and reuse it for the describe() pass
+    numeric_cols = df.select_dtypes('number').columns
+    if len(numeric_cols):
+        stats['numeric_columns'] = tuple(numeric_cols)
+        stats['numeric_stats'] = df[numeric_cols].describe().to_dict()
+
+    return stats
+
 def get_excel_stats():
     """
     Get statistics from Excel data or Google Sheets
+    Local results are memoized on (path, mtime) like the data cache
     """
     try:
         if use_google_sheets():
-            df = read_google_sheet_as_excel()
-        else:
-            df = pd.read_excel(get_excel_path())
-        
-        stats = {
-            'total_rows': len(df),
-            'total_columns': len(df.columns),
-            'columns': list(df.columns),
-            'source': 'Google Sheets' if use_google_sheets() else 'Local Excel',
-        }
-        
-        # Add basic statistics for numeric columns
-        numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
-        if numeric_cols:
-            stats['numeric_columns'] = numeric_cols
-            stats['numeric_stats'] = df[numeric_cols].describe().to_dict()
-        
+            return _compute_excel_stats(read_google_sheet_cached(), 'Google Sheets')
+
+        excel_path = get_excel_path()
+        cache_key = (excel_path, _get_mtime(excel_path))
+        stats = _STATS_CACHE.get(cache_key)
+        if stats is None:
+            df, columns = _load_excel_cached(excel_path)
+            stats = _compute_excel_stats(df, 'Local Excel', columns=columns)
+            _STATS_CACHE.clear()
+            _STATS_CACHE[cache_key] = stats
+
         return stats
     except Exception as e:
         return {'error': str(e)}
@@ -232,68 +444,132 @@ def update_remark(row_index, remark_value):
         
         try:
             sheet_id = get_google_sheet_id()
-            spreadsheet = client.open_by_key(sheet_id)
+            spreadsheet = _open_sheet(sheet_id)
             worksheet = spreadsheet.sheet1  # Use first sheet
             
-            print(f"Updating Google Sheet row {row_index + 2} (Excel row) with remark: {remark_value}")
+            logger.debug("Updating Google Sheet row %d with remark: %s", row_index + 2, remark_value)
             
-            # Find Remark column
-            headers = worksheet.row_values(1)
+            # Find Remark column (cached after the first lookup)
+            headers = _get_header_map(sheet_id, worksheet)
             if 'Remark' not in headers:
                 return {'success': False, 'error': 'Remark column not found in Google Sheet'}
-            
-            remark_col_index = headers.index('Remark') + 1  # gspread uses 1-based indexing
-            
+
+            remark_col_index = headers['Remark']
+
             # Update the cell (row_index + 2 because: +1 for header, +1 for 1-based indexing)
-            worksheet.update_cell(row_index + 2, remark_col_index, remark_value)
-            
-            print(f"✓ Successfully updated Google Sheet")
+            # batch_update so several pending writes can coalesce into one API call
+            worksheet.batch_update([{
+                'range': gspread.utils.rowcol_to_a1(row_index + 2, remark_col_index),
+                'values': [[remark_value]],
+            }])
+
+            logger.debug("Successfully updated Google Sheet")
+
+            # Cached pulls are stale after the write
+            _invalidate_gsheet_cache(sheet_id)
+
             return {'success': True, 'message': 'Remark updated successfully in Google Sheets'}
             
         except Exception as e:
-            print(f"Error updating Google Sheet: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error updating Google Sheet")
             return {'success': False, 'error': f'Failed to update Google Sheet: {str(e)}'}
     
     # Local Excel file update
     excel_path = get_excel_path()
     
-    print(f"update_remark called with row_index={row_index}, remark_value={remark_value}")
-    print(f"Excel path: {excel_path}")
+    logger.debug("update_remark called with row_index=%s, remark_value=%s", row_index, remark_value)
     
     if not os.path.exists(excel_path):
-        print(f"ERROR: Excel file not found at {excel_path}")
+        logger.warning("Excel file not found at %s", excel_path)
         return {'success': False, 'error': 'Excel file not found'}
     
     try:
-        # Read Excel file
-        print("Reading Excel file...")
-        df = pd.read_excel(excel_path)
-        print(f"Excel loaded. Total rows: {len(df)}, Columns: {list(df.columns)}")
-        
-        # Add Remark column if it doesn't exist
-        if 'Remark' not in df.columns:
-            print("Remark column not found, adding it...")
-            df['Remark'] = 'Pending Email'
-        
+        # Touch only the one cell with openpyxl instead of round-tripping
+        # the whole sheet through pandas
+        wb = openpyxl.load_workbook(excel_path)
+        ws = wb.active
+
+        headers = [c.value for c in next(ws.iter_rows(max_row=1))]
+        total_rows = ws.max_row - 1
+
         # Validate row index
-        if row_index < 0 or row_index >= len(df):
-            print(f"ERROR: Invalid row index {row_index}. Valid range: 0-{len(df)-1}")
-            return {'success': False, 'error': f'Invalid row index. Valid range: 0-{len(df)-1}'}
-        
-        # Update the remark
-        print(f"Updating row {row_index} with remark: {remark_value}")
-        df.at[row_index, 'Remark'] = remark_value
-        
+        if row_index < 0 or row_index >= total_rows:
+            logger.warning("Invalid row index %s. Valid range: 0-%d", row_index, total_rows - 1)
+            wb.close()
+            return {'success': False, 'error': f'Invalid row index. Valid range: 0-{total_rows - 1}'}
+
+        # Add Remark column if it doesn't exist
+        if 'Remark' in headers:
+            remark_col = headers.index('Remark') + 1
+        else:
+            logger.debug("Remark column not found, adding it")
+            remark_col = len(headers) + 1
+            ws.cell(row=1, column=remark_col, value='Remark')
+
+        # Update the remark (+2: one for the header row, one for 1-based indexing)
+        logger.debug("Updating row %d with remark: %s", row_index, remark_value)
+        ws.cell(row=row_index + 2, column=remark_col, value=remark_value)
+
         # Save back to Excel
-        print("Saving Excel file...")
-        df.to_excel(excel_path, index=False)
-        print("Excel file saved successfully!")
-        
+        wb.save(excel_path)
+        wb.close()
+        logger.debug("Excel file saved successfully")
+
+        # The file on disk changed, so cached frames are stale
+        _invalidate_excel_cache(excel_path)
+
         return {'success': True, 'message': 'Remark updated successfully'}
     except Exception as e:
-        print(f"ERROR in update_remark: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in update_remark")
         return {'success': False, 'error': str(e)}
+
+def update_remarks_bulk(updates):
+    """
+    Update the Remark column for several rows in one go
+    updates: list of (row_index, remark_value) pairs
+    On Google Sheets all writes coalesce into a single batch_update call
+    """
+    if not updates:
+        return {'success': True, 'message': 'Nothing to update'}
+
+    if use_google_sheets():
+        client = get_gspread_client()
+
+        if not client:
+            return {
+                'success': False,
+                'error': 'Google Sheets write access not configured. Please set up service account credentials (see GOOGLE_SHEETS_WRITE_SETUP.md)'
+            }
+
+        try:
+            sheet_id = get_google_sheet_id()
+            spreadsheet = _open_sheet(sheet_id)
+            worksheet = spreadsheet.sheet1
+
+            headers = _get_header_map(sheet_id, worksheet)
+            if 'Remark' not in headers:
+                return {'success': False, 'error': 'Remark column not found in Google Sheet'}
+
+            remark_col_index = headers['Remark']
+
+            # One API request for the whole batch
+            worksheet.batch_update([{
+                'range': gspread.utils.rowcol_to_a1(row_index + 2, remark_col_index),
+                'values': [[remark_value]],
+            } for row_index, remark_value in updates])
+
+            # Cached pulls are stale after the write
+            _invalidate_gsheet_cache(sheet_id)
+
+            return {'success': True, 'message': f'{len(updates)} remarks updated successfully in Google Sheets'}
+        except Exception as e:
+            logger.exception("Error updating Google Sheet in bulk")
+            return {'success': False, 'error': f'Failed to update Google Sheet: {str(e)}'}
+
+    # Local Excel: apply updates one by one
+    for row_index, remark_value in updates:
+        result = update_remark(row_index, remark_value)
+        if not result.get('success'):
+            return result
+
+    return {'success': True, 'message': f'{len(updates)} remarks updated successfully'}
@@ -1,10 +1,21 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.http import HttpResponse
 from django.utils import timezone
 from .utils import read_excel_data, get_excel_info, get_excel_stats, update_remark
 
+logger = logging.getLogger(__name__)
+
+# Shared pool so endpoints can overlap independent I/O (e.g. a Sheets
+# fetch and the local metadata read) instead of running them serially
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
 class DashboardViewSet(viewsets.ViewSet):
     """
     ViewSet for dashboard operations
@@ -41,13 +52,25 @@ class DashboardViewSet(viewsets.ViewSet):
                 limit = int(limit)
             except ValueError:
                 limit = 100
+            # Zero/negative limits would reach the readers as invalid
+            # nrows / ranges; treat them like any other bad value
+            if limit <= 0:
+                limit = 100
             
-            data = read_excel_data(limit=limit)
-            
-            return Response({
-                'count': len(data),
-                'data': data,
-            })
+            # Fetch the rows and the sheet metadata concurrently, so the
+            # response takes max(fetch, info) instead of their sum
+            data_future = _EXECUTOR.submit(read_excel_data, limit=limit)
+            info_future = _EXECUTOR.submit(get_excel_info)
+
+            count, records_json = data_future.result()
+            excel_info = info_future.result() or {}
+
+            # Splice the pre-serialized rows into the envelope and skip
+            # DRF's renderer entirely for this tabular payload
+            last_modified = orjson.dumps(excel_info.get('last_modified', 'Unknown'))
+            payload = b'{"count": %d, "last_modified": %s, "data": %s}' % (
+                count, last_modified, records_json)
+            return HttpResponse(payload, content_type='application/json')
         except FileNotFoundError as e:
             return Response({
                 'error': str(e),
@@ -76,9 +99,7 @@ class DashboardViewSet(viewsets.ViewSet):
             remark_value = request.data.get('remark_value')
             
             # Debug logging
-            print(f"Received request data: {request.data}")
-            print(f"row_index: {row_index} (type: {type(row_index)})")
-            print(f"remark_value: {remark_value} (type: {type(remark_value)})")
+            logger.debug("update_remark request: row_index=%s, remark_value=%s", row_index, remark_value)
             
             if row_index is None or remark_value is None:
                 return Response({
@@ -93,9 +114,7 @@ class DashboardViewSet(viewsets.ViewSet):
             else:
                 return Response(result, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
-            print(f"Exception in update_remark: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Exception in update_remark")
             return Response({
                 'error': str(e),
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)